@@ -167,9 +167,9 @@ OUTPUT:
     }
 
 NOTES:
-    1. We don't pre-compile the regexes and instead rely on
-    Python's internal caching. This wouldn't be hard to
-    change if a speed improvement is needed.
+    1. The regexes used while parsing are compiled once at module
+    level since they are matched against every word of every
+    docstring.
 """
 
 
@@ -178,6 +178,15 @@ import os
 import re
 from textwrap import indent
 
+_MULTIPLE_SPACES_RE = re.compile(r"\s{2,}")
+_OPERATION_URI_RE = re.compile(r"/MAAS/api/[0-9]+\.[0-9]+/([a-z\-]+)/")
+_WORD_SPLIT_RE = re.compile(r"(\s+|\n)")
+_WHITESPACE_RE = re.compile(r"^[\s]+$")
+_TAG_RE = re.compile(r"@([a-z\-]+)")
+_TYPE_RE = re.compile(r"\(([a-zA-Z0-9\-_]+)\)")
+_NAME_RE = re.compile(r"[\"\']([a-zA-Z0-9\-_{}]+)[\"\']")
+_OPTS_RE = re.compile(r"\[([a-zA-Z0-9\-_=\/;,\.~]+)\]")
+
 
 class APIDocstringParser:
     allowed_tags = [
@@ -438,8 +447,8 @@ class APIDocstringParser:
     # Strips multiple inline spaces, all newlines, and
     # leading and trailing spaces
     def _strip_spaces_and_newlines(self, s):
-        s_stripped = re.sub(r"\s{2,}", " ", s)
-        s_stripped = re.sub(r"\n", " ", s_stripped)
+        s_stripped = _MULTIPLE_SPACES_RE.sub(" ", s)
+        s_stripped = s_stripped.replace("\n", " ")
 
         return s_stripped.rstrip().lstrip()
 
@@ -636,7 +645,7 @@ class APIDocstringParser:
         Given, for example, /MAAS/api/2.0/resourcepool/{id}/, this
         function returns "resourcepool".
         """
-        m = re.search(r"/MAAS/api/[0-9]+\.[0-9]+/([a-z\-]+)/", uri)
+        m = _OPERATION_URI_RE.search(uri)
         if m:
             return m.group(1)
 
@@ -766,7 +775,7 @@ class APIDocstringParser:
         # Use an indexed array so we can simulate a "put back" operation for
         # a one-word lookahead. Split on space (or repeated space) as well as
         # newlines and keep the split chars so indentation will be kept intact.
-        words = re.split(r"(\s+|\n)", docstring)
+        words = _WORD_SPLIT_RE.split(docstring)
         max_idx = len(words)
         idx = 0
 
@@ -776,7 +785,7 @@ class APIDocstringParser:
 
             # Looking for a tag -- @tag
             if ps == ParseState.TAG:
-                m = re.search(r"@([a-z\-]+)", word)
+                m = _TAG_RE.search(word)
                 if m:
                     tag = m.group(1)
                     ps = ParseState.TYPE
@@ -789,33 +798,33 @@ class APIDocstringParser:
 
             # Looking for a type -- (type)
             elif ps == ParseState.TYPE:
-                m = re.search(r"\(([a-zA-Z0-9\-_]+)\)", word)
+                m = _TYPE_RE.search(word)
                 if m:
                     ttype = m.group(1)
                     ps = ParseState.NAME
-                elif not re.search(r"^[\s]+$", word):
+                elif not _WHITESPACE_RE.search(word):
                     ps = ParseState.NAME
                     # Put the word back
                     idx -= 1
 
             # Looking for a name -- "name"/'name'
             elif ps == ParseState.NAME:
-                m = re.search(r"[\"\']([a-zA-Z0-9\-_{}]+)[\"\']", word)
+                m = _NAME_RE.search(word)
                 if m:
                     tname = m.group(1)
                     ps = ParseState.OPTS
-                elif not re.search(r"^[\s]+$", word):
+                elif not _WHITESPACE_RE.search(word):
                     ps = ParseState.OPTS
                     # Put the word back
                     idx -= 1
 
             # Looking for options -- [options]
             elif ps == ParseState.OPTS:
-                m = re.search(r"\[([a-zA-Z0-9\-_=\/;,\.~]+)\]", word)
+                m = _OPTS_RE.search(word)
                 if m:
                     opts = m.group(1)
                     ps = ParseState.DESC
-                elif not re.search(r"^[\s]+$", word):
+                elif not _WHITESPACE_RE.search(word):
                     ps = ParseState.DESC
                     # Put the word back
                     idx -= 1
@@ -191,45 +191,48 @@ class EventsHandler(OperationsHandler):
         # into a list now so that len() is cheap.
         events = list(events)
 
-        # Helper for building prev_uri and next_uri.
-        def make_uri(params, base=reverse("events_handler")):
-            query = urllib.parse.urlencode(params, doseq=True)
-            url = urllib.parse.urlparse(base)._replace(query=query)
-            return url.geturl()
+        # The filter parameters are shared by prev_uri and next_uri, so
+        # work them out once and only set the paging parameters per URI.
+        base_uri = urllib.parse.urlparse(reverse("events_handler"))
+        base_params = dict(
+            get_overridden_query_dict(request.GET, {}, self.all_params).items()
+        )
+
+        # Helper for building prev_uri and next_uri. The `exclude`d paging
+        # parameter is dropped; combining `before` and `after` is an error.
+        def make_uri(exclude, **params):
+            query = {
+                key: value
+                for key, value in base_params.items()
+                if key != exclude
+            }
+            query.update(params)
+            query = urllib.parse.urlencode(query, doseq=True)
+            return base_uri._replace(query=query).geturl()
 
         # Figure out a URI to obtain a set of newer events.
-        next_uri_params = get_overridden_query_dict(
-            request.GET, {"before": []}, self.all_params
-        )
         if len(events) == 0:
             if before is None:
                 # There are no newer events NOW, but there may be later.
-                next_uri = make_uri(next_uri_params)
+                next_uri = make_uri("before")
             else:
                 # Without limiting to `before`, we might find some more events.
-                next_uri_params["after"] = before - 1
-                next_uri = make_uri(next_uri_params)
+                next_uri = make_uri("before", after=before - 1)
         else:
             # The first event is the newest.
-            next_uri_params["after"] = str(events[0].id)
-            next_uri = make_uri(next_uri_params)
+            next_uri = make_uri("before", after=str(events[0].id))
 
         # Figure out a URI to obtain a set of older events.
-        prev_uri_params = get_overridden_query_dict(
-            request.GET, {"after": []}, self.all_params
-        )
         if len(events) == 0:
             if after is None:
                 # There are no older events and never will be.
                 prev_uri = None
             else:
                 # Without limiting to `after`, we might find some more events.
-                prev_uri_params["before"] = after + 1
-                prev_uri = make_uri(prev_uri_params)
+                prev_uri = make_uri("after", before=after + 1)
         else:
             # The last event is the oldest.
-            prev_uri_params["before"] = str(events[-1].id)
-            prev_uri = make_uri(prev_uri_params)
+            prev_uri = make_uri("after", before=str(events[-1].id))
 
         return {
             "count": len(events),
@@ -1835,9 +1835,9 @@ class AnonMachinesHandler(AnonNodesHandler):
             params = json.loads(power_parameters)
             machine = Machine.objects.filter(
                 status__in=[NODE_STATUS.NEW, NODE_STATUS.COMMISSIONING],
-                bmc__power_parameters__power_address=(
-                    params.get("power_address", "")
-                ),
+                bmc__power_parameters__contains={
+                    "power_address": params.get("power_address", "")
+                },
             ).first()
             if machine is not None:
                 machine = self._update_new_node(
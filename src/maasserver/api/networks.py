@@ -4,6 +4,7 @@
 """API handlers: `Network`."""
 
 
+from django.db.models.functions import Lower
 from django.urls import reverse
 from piston3.utils import rc
 
@@ -116,25 +117,18 @@ class NetworkHandler(OperationsHandler):
         visible_nodes = Node.objects.get_nodes(
             request.user, NodePermission.view, from_nodes=Node.objects.all()
         )
-        interfaces = Interface.objects.filter(
-            node__in=visible_nodes, ip_addresses__subnet=subnet
-        )
-        existing_macs = set()
-        unique_interfaces_by_mac = [
-            interface
-            for interface in interfaces
-            if (
-                interface.mac_address not in existing_macs
-                and not existing_macs.add(interface.mac_address)
+        # Let the database do the sorting; the MACs only need to be made
+        # unique here, keeping the first (lowest sorting) occurrence.
+        mac_addresses = (
+            Interface.objects.filter(
+                node__in=visible_nodes, ip_addresses__subnet=subnet
             )
-        ]
-        unique_interfaces_by_mac = sorted(
-            unique_interfaces_by_mac,
-            key=lambda x: (x.node.hostname.lower(), x.mac_address.get_raw()),
+            .order_by(Lower("node__hostname"), "mac_address")
+            .values_list("mac_address", flat=True)
         )
         return [
-            {"mac_address": str(interface.mac_address)}
-            for interface in unique_interfaces_by_mac
+            {"mac_address": str(mac_address)}
+            for mac_address in dict.fromkeys(mac_addresses)
         ]
 
     @classmethod
@@ -30,6 +30,7 @@ __all__ = [
 ]
 
 from copy import deepcopy
+from functools import lru_cache
 from operator import itemgetter
 
 from django import forms
@@ -248,6 +249,17 @@ def get_all_power_types():
         provisioningserver.drivers.power.JSON_POWER_DRIVERS_SCHEMA or
         provisioningserver.drivers.pod.JSON_POD_DRIVERS_SCHEMA
     """
+    # Callers can mutate this, so deep copy.
+    return deepcopy(_get_all_power_types())
+
+
+@lru_cache(maxsize=1)
+def _get_all_power_types():
+    """Build and validate the power types from the PowerDriverRegistry.
+
+    The registered drivers don't change while the region is running, so
+    this only needs to be done once per process.
+    """
     merged_types = []
     for power_type_orig in PowerDriverRegistry.get_schema(
         detect_missing_packages=False
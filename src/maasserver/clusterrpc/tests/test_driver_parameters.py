@@ -8,6 +8,7 @@ from maasserver.clusterrpc import driver_parameters
 from maasserver.clusterrpc.driver_parameters import (
     add_nos_driver_parameters,
     add_power_driver_parameters,
+    get_all_power_types,
     get_driver_parameters_from_json,
     get_driver_types,
     JSON_POWER_DRIVERS_SCHEMA,
@@ -545,3 +546,18 @@ class TestPowerTypes(MAASTestCase):
         ]
         expected = {"namevalue": "descvalue", "namevalue2": "descvalue2"}
         self.assertEqual(expected, get_driver_types())
+
+    def test_get_all_power_types_builds_types_once(self):
+        driver_parameters._get_all_power_types.cache_clear()
+        self.addCleanup(driver_parameters._get_all_power_types.cache_clear)
+        get_schema = self.patch(
+            driver_parameters.PowerDriverRegistry, "get_schema"
+        )
+        get_schema.return_value = []
+        self.assertEqual(get_all_power_types(), get_all_power_types())
+        get_schema.assert_called_once_with(detect_missing_packages=False)
+
+    def test_get_all_power_types_returns_copies(self):
+        power_types = get_all_power_types()
+        power_types[0]["fields"].append({"name": "mutated"})
+        self.assertNotEqual(power_types, get_all_power_types())
@@ -12,6 +12,7 @@ from django.core.exceptions import ValidationError
 from django.forms.fields import Field
 from django.forms.utils import ErrorList
 from django.forms.widgets import Widget
+from django.utils.html import format_html
 from django.utils.safestring import mark_safe
 
 SKIP_CHECK_NAME = "skip_check"
@@ -299,14 +300,17 @@ class DictCharWidget(forms.widgets.MultiWidget):
                 final_attrs = dict(
                     final_attrs, id="%s_%s" % (id_, self.names[index])
                 )
-            # Add label to each sub-field.
+            # Add label to each sub-field, escaping it so that a label
+            # containing markup can't break the rendered fieldset.
             if id_:
-                label_for = ' for="%s"' % final_attrs["id"]
+                label = format_html(
+                    '<label for="{}">{}</label>',
+                    final_attrs["id"],
+                    self.labels[index],
+                )
             else:
-                label_for = ""
-            output.append(
-                "<label%s>%s</label>" % (label_for, self.labels[index])
-            )
+                label = format_html("<label>{}</label>", self.labels[index])
+            output.append(label)
             output.append(
                 widget.render(
                     "%s_%s" % (name, self.names[index]),
@@ -271,8 +271,8 @@ class PodForm(MAASModelForm):
         # those fields. If updating the fields causes a duplicate BMC then
         # a validation erorr will be raised from the model level.
         if self.is_new:
-            bmc = BMC.objects.filter(
-                power_type=power_type, power_parameters=power_parameters
+            bmc = BMC.objects.filter_by_power_parameters(
+                power_type, power_parameters
             ).first()
             if bmc is not None:
                 if bmc.bmc_type == BMC_TYPE.BMC:
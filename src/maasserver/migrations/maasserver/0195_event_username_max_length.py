@@ -11,19 +11,42 @@ class Migration(migrations.Migration):
     dependencies = [("maasserver", "0194_machine_listing_event_index")]
 
     operations = [
-        migrations.AlterField(
-            model_name="event",
-            name="node",
-            field=models.ForeignKey(
-                editable=False,
-                null=True,
-                on_delete=django.db.models.deletion.SET_NULL,
-                to="maasserver.Node",
-            ),
-        ),
-        migrations.AlterField(
-            model_name="event",
-            name="username",
-            field=models.CharField(blank=True, default="", max_length=150),
+        # The change to event.node doesn't affect the database, but applying
+        # it would drop and recreate the foreign key constraint, which
+        # requires validating it over the whole event table. Only apply the
+        # username change to the database.
+        #
+        # Widening a varchar column doesn't require rewriting the table. The
+        # SQL is written explicitly, without the USING clause Django adds.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    "ALTER TABLE maasserver_event"
+                    " ALTER COLUMN username TYPE varchar(150)",
+                    reverse_sql=(
+                        "ALTER TABLE maasserver_event"
+                        " ALTER COLUMN username TYPE varchar(32)"
+                    ),
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="event",
+                    name="node",
+                    field=models.ForeignKey(
+                        editable=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to="maasserver.Node",
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="event",
+                    name="username",
+                    field=models.CharField(
+                        blank=True, default="", max_length=150
+                    ),
+                ),
+            ],
         ),
     ]
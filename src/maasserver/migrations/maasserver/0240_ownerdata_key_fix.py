@@ -2,41 +2,169 @@
 
 import re
 
-from django.contrib.postgres.aggregates import ArrayAgg
-from django.db import migrations
+from django.db import migrations, transaction
 
 REPLACE_RE = re.compile(r"[^\w.-]")
 
 
-def fix_ownerdata_keys(apps, schema_editor):
-    OwnerData = apps.get_model("maasserver", "OwnerData")
+class KeyTranslation(dict):
+    """Translation table for str.translate() replacing invalid characters.
+
+    Characters are checked against REPLACE_RE the first time they're found.
+    """
+
+    def __missing__(self, codepoint):
+        value = "_" if REPLACE_RE.match(chr(codepoint)) else codepoint
+        self[codepoint] = value
+        return value
+
+
+KEY_TRANSLATION = KeyTranslation()
+
+# number of entries to rewrite with a single UPDATE query, each batch is
+# committed separately
+BATCH_SIZE = 1000
+
+# Entries that might have invalid keys. PostgreSQL's \w depends on the
+# database locale, so match anything that isn't an ASCII word character; keys
+# that are valid with Python's Unicode \w are left alone by fix_keys_batch.
+BAD_KEY_DB_RE = r"[^A-Za-z0-9_.-]"
+
+# Rewrite invalid keys directly in the database, as long as the new key
+# doesn't clash with any other key (either existing or rewritten) for the same
+# node. Only ASCII keys are rewritten here, where the ASCII class matches
+# Python's \w. Clashing and non-ASCII entries are left to fix_ownerdata_keys.
+FIX_OWNERDATA_KEYS_SQL = r"""
+    UPDATE maasserver_ownerdata AS entry
+    SET key = regexp_replace(entry.key, '[^A-Za-z0-9_.-]', '_', 'g')
+    WHERE
+        entry.key ~ '[^A-Za-z0-9_.-]'
+        AND entry.key !~ '[^\x01-\x7f]'
+        AND NOT EXISTS (
+            SELECT 1 FROM maasserver_ownerdata AS other
+            WHERE
+                other.node_id = entry.node_id
+                AND other.id != entry.id
+                AND regexp_replace(other.key, '[^A-Za-z0-9_.-]', '_', 'g') =
+                    regexp_replace(entry.key, '[^A-Za-z0-9_.-]', '_', 'g')
+        )
+    """
+
+# Temporary partial index to look up entries with invalid keys without
+# scanning the whole table each time.
+CREATE_BAD_KEY_INDEX_SQL = r"""
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS tmp_ownerdata_badkey_idx
+    ON maasserver_ownerdata (id)
+    WHERE key ~ '[^A-Za-z0-9_.-]'
+    """
+
+DROP_BAD_KEY_INDEX_SQL = (
+    "DROP INDEX CONCURRENTLY IF EXISTS tmp_ownerdata_badkey_idx"
+)
 
-    existing_node_keys = {
-        node_id: set(values)
-        for node_id, values in OwnerData.objects.values_list(
-            "node_id"
-        ).annotate(keys=ArrayAgg("key"))
+
+def fix_keys_batch(OwnerData, schema_editor, entries):
+    """Rewrite invalid keys for a batch of OwnerData `entries`.
+
+    New keys that clash with another key for the same node get a numeric
+    suffix. Clashes with existing keys are checked in the database for the
+    whole batch at once, until no clash is left.
+    """
+    connection = schema_editor.connection
+    base_keys = {
+        entry.id: entry.key.translate(KEY_TRANSLATION) for entry in entries
+    }
+    # The database and Python can disagree on what \w matches (e.g. for
+    # non-ASCII letters, depending on the database locale). Keys that don't
+    # change are left alone, but still taken.
+    assigned = {
+        (entry.node_id, entry.key)
+        for entry in entries
+        if base_keys[entry.id] == entry.key
     }
+    entries = [entry for entry in entries if base_keys[entry.id] != entry.key]
+    suffixes = dict.fromkeys(base_keys, 0)
+    pending = entries
+    while pending:
+        new_keys = {
+            entry.id: (
+                f"{base_keys[entry.id]}_{suffixes[entry.id]}"
+                if suffixes[entry.id]
+                else base_keys[entry.id]
+            )
+            for entry in pending
+        }
+        # the batch's own keys are either being replaced or in `assigned`
+        existing = set(
+            OwnerData.objects.using(connection.alias)
+            .filter(
+                node_id__in={entry.node_id for entry in pending},
+                key__in=set(new_keys.values()),
+            )
+            .exclude(id__in=base_keys)
+            .values_list("node_id", "key")
+        )
+        clashing = []
+        for entry in pending:
+            node_key = (entry.node_id, new_keys[entry.id])
+            if node_key in existing or node_key in assigned:
+                suffixes[entry.id] += 1
+                clashing.append(entry)
+            else:
+                assigned.add(node_key)
+                entry.key = new_keys[entry.id]
+        pending = clashing
+
+    if not entries:
+        return
+
+    with transaction.atomic(using=connection.alias):
+        # don't wait for each batch to be flushed to disk. Batches lost on a
+        # crash are fixed when the migration is run again, since it's only
+        # recorded as applied once all batches are done.
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL synchronous_commit = off")
+        OwnerData.objects.using(connection.alias).bulk_update(entries, ["key"])
 
-    for entry in OwnerData.objects.exclude(key__regex=r"^[\w.-]+$"):
-        orig_key = entry.key
 
-        node_keys = existing_node_keys[entry.node_id]
-        node_keys.remove(orig_key)
+def fix_ownerdata_keys(apps, schema_editor):
+    OwnerData = apps.get_model("maasserver", "OwnerData")
+
+    bad_entries = OwnerData.objects.using(
+        schema_editor.connection.alias
+    ).filter(key__regex=BAD_KEY_DB_RE)
+    if not bad_entries.exists():
+        return
 
-        new_key = REPLACE_RE.sub("_", entry.key)
-        while new_key in node_keys:
-            new_key += "_"
-        node_keys.add(new_key)
+    batch = []
+    entries = (
+        bad_entries.only("id", "node_id", "key")
+        .order_by("node_id", "id")
+        .iterator(chunk_size=2000)
+    )
+    for entry in entries:
+        batch.append(entry)
+        if len(batch) >= BATCH_SIZE:
+            fix_keys_batch(OwnerData, schema_editor, batch)
+            batch = []
 
-        entry.key = new_key
-        entry.save()
+    if batch:
+        fix_keys_batch(OwnerData, schema_editor, batch)
 
 
 class Migration(migrations.Migration):
 
+    # entries are fixed in batches, each in its own transaction, and indexes
+    # are created concurrently
+    atomic = False
+
     dependencies = [
         ("maasserver", "0239_add_iprange_specific_dhcp_snippets"),
     ]
 
-    operations = [migrations.RunPython(fix_ownerdata_keys)]
+    operations = [
+        migrations.RunSQL(CREATE_BAD_KEY_INDEX_SQL),
+        migrations.RunSQL(FIX_OWNERDATA_KEYS_SQL),
+        migrations.RunPython(fix_ownerdata_keys),
+        migrations.RunSQL(DROP_BAD_KEY_INDEX_SQL),
+    ]
@@ -0,0 +1,71 @@
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # 0245 has already been applied on existing installs and is left as
+    # released, so changes to the BMC indexes it created are made here.
+    #
+    # indexes are built and dropped concurrently to avoid blocking writes on
+    # the table
+    atomic = False
+
+    dependencies = [
+        ("maasserver", "0255_node_current_config"),
+    ]
+
+    operations = [
+        # give index builds more memory to sort entries
+        migrations.RunSQL("SET maintenance_work_mem = '1GB'"),
+        # index the content of power_parameters for containment queries on
+        # specific parameters. jsonb_path_ops makes for a smaller index than
+        # the default operator class, and still supports @>.
+        #
+        # An interrupted concurrent build leaves an invalid index behind, so
+        # drop any existing one before building it.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    "DROP INDEX CONCURRENTLY IF EXISTS"
+                    " bmc_power_parameters_gin_idx"
+                ),
+                migrations.RunSQL(
+                    """
+                    CREATE INDEX CONCURRENTLY
+                    bmc_power_parameters_gin_idx
+                    ON maasserver_bmc
+                    USING gin (power_parameters jsonb_path_ops)
+                    """
+                ),
+            ],
+            state_operations=[
+                migrations.AddIndex(
+                    model_name="bmc",
+                    index=django.contrib.postgres.indexes.GinIndex(
+                        fields=["power_parameters"],
+                        name="bmc_power_parameters_gin_idx",
+                        opclasses=["jsonb_path_ops"],
+                    ),
+                ),
+            ],
+        ),
+        # lookups by power parameters go through the unique index on
+        # (power_type, md5(power_parameters::text)), so the hash index on
+        # the whole content is only extra work on writes.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    "DROP INDEX CONCURRENTLY IF EXISTS"
+                    " maasserver__power_p_511df2_hash"
+                ),
+            ],
+            state_operations=[
+                migrations.RemoveIndex(
+                    model_name="bmc",
+                    name="maasserver__power_p_511df2_hash",
+                ),
+            ],
+        ),
+        migrations.RunSQL("RESET maintenance_work_mem"),
+    ]
@@ -10,7 +10,7 @@ import re
 from statistics import mean
 
 from django.contrib.postgres.fields import ArrayField, JSONField
-from django.contrib.postgres.indexes import HashIndex
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.core.validators import MinValueValidator
 from django.db import transaction
@@ -19,8 +19,10 @@ from django.db.models import (
     BooleanField,
     CASCADE,
     CharField,
+    F,
     FloatField,
     ForeignKey,
+    Func,
     IntegerField,
     Manager,
     ManyToManyField,
@@ -30,7 +32,9 @@ from django.db.models import (
     SET_NULL,
     TextField,
     UniqueConstraint,
+    Value,
 )
+from django.db.models.functions import Cast
 from django.db.models.query import QuerySet
 from django.shortcuts import get_object_or_404
 from netaddr import AddrFormatError, IPAddress
@@ -110,6 +114,15 @@ def get_ip_modes(requested_machine):
     return ip_modes
 
 
+def _power_parameters_md5(expression):
+    """Return the MD5 hash of the text for the JSON `expression`."""
+    return Func(
+        Cast(expression, TextField()),
+        function="md5",
+        output_field=TextField(),
+    )
+
+
 class BaseBMCManager(Manager):
     """A utility to manage the collection of BMCs."""
 
@@ -119,6 +132,23 @@ class BaseBMCManager(Manager):
         queryset = QuerySet(self.model, using=self._db)
         return queryset.filter(**self.extra_filters)
 
+    def filter_by_power_parameters(self, power_type, power_parameters):
+        """Return BMCs with the specified power type and parameters.
+
+        Parameters are also matched by their MD5 hash, so that the unique
+        index on power type and parameters hash is used for the lookup.
+        """
+        parameters = Cast(
+            Value(power_parameters, output_field=JSONField()), JSONField()
+        )
+        return self.annotate(
+            power_parameters_md5=_power_parameters_md5(F("power_parameters"))
+        ).filter(
+            power_type=power_type,
+            power_parameters=power_parameters,
+            power_parameters_md5=_power_parameters_md5(parameters),
+        )
+
 
 class BMCManager(BaseBMCManager):
     """Manager for `BMC` not `Pod`'s."""
@@ -145,12 +175,22 @@ class BMC(CleanSave, TimestampedModel):
     """
 
     class Meta(DefaultMeta):
-        # power_type and power_parameters have indexes in addition of the
-        # combined unique one as the unique one uses MD5 hash of the content
-        # and would not be used for queries looking for exact content. Here we
-        # use a HASH index to get around the size limitation on the content of
-        # the indexed object
-        indexes = (HashIndex(fields=("power_parameters",)),)
+        # power_type and power_parameters have a combined unique index on the
+        # MD5 hash of the content (see migration 0245), since the content
+        # itself might exceed the size limit for index entries. Lookups must
+        # go through BMC.objects.filter_by_power_parameters() to make use of
+        # it. MD5 is used rather than a cheaper 64-bit hash, since a
+        # collision would reject BMCs whose parameters differ.
+        #
+        # A GIN index also allows looking up BMCs by specific parameters,
+        # through containment queries (power_parameters__contains).
+        indexes = (
+            GinIndex(
+                name="bmc_power_parameters_gin_idx",
+                fields=("power_parameters",),
+                opclasses=["jsonb_path_ops"],
+            ),
+        )
         constraints = [
             UniqueConstraint(
                 name="name-unique",
@@ -159,7 +199,7 @@ class BMC(CleanSave, TimestampedModel):
             ),
         ]
 
-    objects = Manager()
+    objects = BaseBMCManager()
 
     bmcs = BMCManager()
 
@@ -59,7 +59,7 @@ from django.db.models import (
 )
 from django.db.models.query import QuerySet
 from django.shortcuts import get_object_or_404
-from netaddr import IPAddress, IPNetwork
+from netaddr import IPAddress
 import petname
 from twisted.internet import reactor
 from twisted.internet.defer import (
@@ -1367,8 +1367,8 @@ class Node(CleanSave, TimestampedModel):
                 self.bmc.power_parameters = bmc_params
                 self.bmc.save()
             else:
-                existing_bmc = BMC.objects.filter(
-                    power_type=power_type, power_parameters=bmc_params
+                existing_bmc = BMC.objects.filter_by_power_parameters(
+                    power_type, bmc_params
                 ).first()
                 if existing_bmc and existing_bmc.id != self.bmc_id:
                     if self.bmc:
@@ -1386,9 +1386,9 @@ class Node(CleanSave, TimestampedModel):
                         )
                     self.bmc.save()
         elif chassis:
-            self.bmc, _ = BMC.objects.get_or_create(
-                power_type=power_type, power_parameters=bmc_params
-            )
+            self.bmc, _ = BMC.objects.filter_by_power_parameters(
+                power_type, bmc_params
+            ).get_or_create(power_type=power_type, power_parameters=bmc_params)
         else:
             self.bmc = BMC.objects.create(
                 power_type=power_type, power_parameters=bmc_params
@@ -5431,8 +5431,16 @@ class Node(CleanSave, TimestampedModel):
                     IPADDRESS_TYPE.DHCP,
                 ],
             )
-            cidrs = subnets.values_list("cidr", flat=True)
-            my_address_families = {IPNetwork(cidr).version for cidr in cidrs}
+            # Let the database work out the address families rather than
+            # pulling every CIDR back and parsing it with netaddr.
+            my_address_families = set(
+                subnets.extra(
+                    select={"family": "family(maasserver_subnet.cidr)"}
+                )
+                .values_list("family", flat=True)
+                .order_by()
+                .distinct()
+            )
             rack_address_families = set(
                 4 if addr.is_ipv4_mapped() else addr.version
                 for addr in get_maas_facing_server_addresses(
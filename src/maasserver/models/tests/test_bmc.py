@@ -622,6 +622,26 @@ class TestBMC(MAASServerTestCase):
             HasLength(len(non_routable_racks)),
         )
 
+    def test_filter_by_power_parameters(self):
+        power_parameters = {
+            "power_address": factory.make_ip_address(),
+            "power_user": factory.make_name("user"),
+        }
+        bmc = factory.make_BMC(
+            power_type="ipmi", power_parameters=power_parameters
+        )
+        factory.make_BMC(
+            power_type="ipmi",
+            power_parameters={"power_address": factory.make_ip_address()},
+        )
+        factory.make_BMC(
+            power_type="redfish", power_parameters=power_parameters
+        )
+        self.assertCountEqual(
+            [bmc],
+            BMC.objects.filter_by_power_parameters("ipmi", power_parameters),
+        )
+
 
 class TestPodManager(MAASServerTestCase):
     def enable_rbac(self):
@@ -924,11 +924,15 @@ def get_node_preseed_context(request, node, osystem="", release=""):
         reverse("metadata-node-by-id", args=["latest", node.system_id])
     )
     node_disable_pxe_data = urlencode({"op": "netboot_off"})
-    driver = get_third_party_driver(node, series=release)
+    third_party_drivers = Config.objects.get_config(
+        "enable_third_party_drivers"
+    )
+    if third_party_drivers:
+        driver = get_third_party_driver(node, series=release)
+    else:
+        driver = {}
     return {
-        "third_party_drivers": (
-            Config.objects.get_config("enable_third_party_drivers")
-        ),
+        "third_party_drivers": third_party_drivers,
         "driver": driver,
         "driver_package": driver.get("package", ""),
         "node": node,
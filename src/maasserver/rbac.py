@@ -3,7 +3,7 @@ from functools import partial
 import http.client
 import threading
 from typing import Mapping, Sequence, Union
-from urllib.parse import parse_qs, quote, urlparse
+from urllib.parse import parse_qs, quote, urlencode, urlparse
 
 import attr
 
@@ -128,13 +128,11 @@ class RBACClient(MacaroonClient):
         `resource_type` that the user can access. An object of `ALL_RESOURCES`
         means the user can access all resources of that type.
         """
-        url = self._get_resource_type_url(
-            resource_type
-        ) + "/allowed-for-user?u={}&{}".format(
-            quote(user),
-            "&".join(
-                ["p=%s" % quote(permission) for permission in permissions]
-            ),
+        query = [("u", user)]
+        query.extend(("p", permission) for permission in permissions)
+        url = "{}/allowed-for-user?{}".format(
+            self._get_resource_type_url(resource_type),
+            urlencode(query, safe="/", quote_via=quote),
         )
         result = self._request("GET", url)
         for permission, res in result.items():
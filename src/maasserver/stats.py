@@ -394,9 +394,14 @@ def get_maas_stats():
     # - architectures
     # - resource pools
     # - pods
-    # Get all node types to get count values
-    node_types = Node.objects.values_list("node_type", flat=True)
-    node_types = Counter(node_types)
+    # Count the nodes of each type in the database rather than loading the
+    # type of every node.
+    node_types = {
+        entry["node_type"]: entry["count"]
+        for entry in Node.objects.values("node_type").annotate(
+            count=Count("id")
+        )
+    }
     # get summary of machine resources, and its statuses.
     stats = get_machine_stats()
     machine_status = get_machine_state_stats()
@@ -249,6 +249,16 @@ class TestDictCharWidget(MAASServerTestCase):
             [widget_names, widget_labels, widget_values],
         )
 
+    def test_DictCharWidget_escapes_labels(self):
+        label = "<b>%s</b>" % factory.make_string()
+        widget = DictCharWidget(
+            [widgets.TextInput()], [factory.make_string()], [], [label]
+        )
+        html_widget = fromstring(
+            "<root>" + widget.render(factory.make_string(), "") + "</root>"
+        )
+        self.assertEqual([label], XPath("fieldset/label/text()")(html_widget))
+
     def test_empty_DictCharWidget_renders_as_empty_string(self):
         widget = DictCharWidget(
             [widgets.CheckboxInput], [], [], [], skip_check=True
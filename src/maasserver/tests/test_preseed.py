@@ -623,6 +623,22 @@ class TestNodePreseedContext(
             enable_third_party_drivers, context["third_party_drivers"]
         )
 
+    def test_context_skips_third_party_driver_when_disabled(self):
+        node = factory.make_Node_with_Interface_on_Subnet(
+            primary_rack=self.rpc_rack_controller
+        )
+        self.configure_get_boot_images_for_node(node, "install")
+        Config.objects.set_config("enable_third_party_drivers", False)
+        get_third_party_driver = self.patch(
+            preseed_module, "get_third_party_driver"
+        )
+        context = get_node_preseed_context(
+            make_HttpRequest(), node, factory.make_string()
+        )
+        self.assertEqual({}, context["driver"])
+        self.assertEqual("", context["driver_package"])
+        get_third_party_driver.assert_not_called()
+
 
 class TestPreseedTemplate(MAASTestCase):
     """Tests for class:`PreseedTemplate`."""
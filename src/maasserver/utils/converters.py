@@ -13,7 +13,11 @@ from provisioningserver.utils import typed
 
 
 class XMLToYAML:
-    """Convert XML to YAML."""
+    """Convert XML to YAML.
+
+    `text` may be an XML string or an already parsed element, which saves
+    serialising a tree only to parse it again here.
+    """
 
     def __init__(self, text):
         self.text = text
@@ -47,7 +51,10 @@ class XMLToYAML:
             self.level -= 1
 
     def convert(self):
-        root = etree.fromstring(self.text)
+        if etree.iselement(self.text):
+            root = self.text
+        else:
+            root = etree.fromstring(self.text)
         self.addText(root)
         self.recurseElement(root)
         return self.new_text
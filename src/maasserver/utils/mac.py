@@ -4,23 +4,42 @@
 """MAC-related utilities."""
 
 
+from functools import lru_cache
 import re
 
-from netaddr import EUI, NotRegisteredError
+from netaddr import EUI, NotRegisteredError, OUI
+
+UNKNOWN_VENDOR = "Unknown Vendor"
+
+# The locally administered bit of the first octet, as it appears in the OUI.
+LOCALLY_ADMINISTERED_OUI_BIT = 0x020000
 
 
 def get_vendor_for_mac(mac):
     """Return vendor for MAC."""
-    data = EUI(mac)
+    # Only the OUI (the top 24 bits) identifies the vendor, so look up and
+    # cache on that rather than on the full address.
+    oui = EUI(mac).value >> 24
+    if oui & LOCALLY_ADMINISTERED_OUI_BIT:
+        # Locally administered addresses (such as those commonly given to
+        # VMs and containers) aren't assigned by a vendor, so there's no
+        # point looking them up.
+        return UNKNOWN_VENDOR
+    return _get_vendor_for_oui(oui)
+
+
+@lru_cache(maxsize=4096)
+def _get_vendor_for_oui(oui):
+    """Return vendor for the OUI, given as an integer."""
     try:
-        return data.oui.registration().org
+        return OUI(oui).registration().org
     except (IndexError, NotRegisteredError, UnicodeDecodeError):
         # Bug#1655049: IndexError is raised for some unicode strings.  See also
         # Bug#1628761.
         # UnicodeDecodeError can be raised if the name of the vendor cannot
         # be decoded from ascii. This is something broken in the netaddr
         # library, we are just catching the error here not to break the UI.
-        return "Unknown Vendor"
+        return UNKNOWN_VENDOR
 
 
 def is_mac(mac):
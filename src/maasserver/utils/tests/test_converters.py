@@ -6,6 +6,8 @@
 
 from textwrap import dedent
 
+from lxml import etree
+
 from maasserver.utils.converters import (
     human_readable_bytes,
     machine_readable_bytes,
@@ -37,6 +39,18 @@ class TestXMLToYAML(MAASTestCase):
         yml = XMLToYAML(xml)
         self.assertEqual(yml.convert(), expected_result)
 
+    def test_xml_to_yaml_converts_element(self):
+        xml = """
+        <list xmlns:lldp="lldp" xmlns:lshw="lshw">
+         <lldp:lldp label="LLDP neighbors"/>
+         <lshw:list>Some Content</lshw:list>
+        </list>
+        """
+        self.assertEqual(
+            XMLToYAML(xml).convert(),
+            XMLToYAML(etree.fromstring(xml)).convert(),
+        )
+
 
 class TestHumanReadableBytes(MAASTestCase):
 
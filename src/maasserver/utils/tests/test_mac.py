@@ -14,6 +14,11 @@ from maastesting.testcase import MAASTestCase
 
 
 class TestGetVendorForMac(MAASTestCase):
+    def setUp(self):
+        super().setUp()
+        mac._get_vendor_for_oui.cache_clear()
+        self.addCleanup(mac._get_vendor_for_oui.cache_clear)
+
     def test_get_vendor_for_mac_returns_vendor(self):
         mac_address = "ec:a8:6b:fd:ae:3f"
         self.assertThat(get_vendor_for_mac(mac_address), IsNonEmptyString)
@@ -28,9 +33,9 @@ class TestGetVendorForMac(MAASTestCase):
             b"\xD3".decode("ascii")
         except UnicodeDecodeError as exc:
             error = exc
-        eui_result = MagicMock()
-        eui_result.oui.registration.side_effect = error
-        self.patch(mac, "EUI").return_value = eui_result
+        oui_result = MagicMock()
+        oui_result.registration.side_effect = error
+        self.patch(mac, "OUI").return_value = oui_result
         self.assertEqual(
             "Unknown Vendor", get_vendor_for_mac(factory.make_mac_address())
         )
@@ -41,13 +46,29 @@ class TestGetVendorForMac(MAASTestCase):
             arr[3]
         except IndexError as exc:
             error = exc
-        eui_result = MagicMock()
-        eui_result.oui.registration.side_effect = error
-        self.patch(mac, "EUI").return_value = eui_result
+        oui_result = MagicMock()
+        oui_result.registration.side_effect = error
+        self.patch(mac, "OUI").return_value = oui_result
         self.assertEqual(
             "Unknown Vendor", get_vendor_for_mac(factory.make_mac_address())
         )
 
+    def test_get_vendor_for_mac_skips_locally_administered_mac(self):
+        mock_oui = self.patch(mac, "OUI")
+        self.assertEqual(
+            "Unknown Vendor", get_vendor_for_mac("52:54:00:12:34:56")
+        )
+        mock_oui.assert_not_called()
+
+    def test_get_vendor_for_mac_caches_by_oui(self):
+        oui_result = MagicMock()
+        oui_result.registration.return_value.org = "Vendor"
+        mock_oui = self.patch(mac, "OUI")
+        mock_oui.return_value = oui_result
+        self.assertEqual("Vendor", get_vendor_for_mac("ec:a8:6b:fd:ae:3f"))
+        self.assertEqual("Vendor", get_vendor_for_mac("ec:a8:6b:00:00:01"))
+        mock_oui.assert_called_once_with(0xECA86B)
+
 
 class TestIsMac(MAASTestCase):
     def test_true(self):
@@ -6,25 +6,21 @@
 
 from collections import Counter
 from functools import cached_property
-import logging
 
 from django.contrib.postgres.aggregates import ArrayAgg
-from django.db.models import (
-    BooleanField,
-    ExpressionWrapper,
-    OuterRef,
-    Q,
-    Subquery,
-)
+from django.db.models import BooleanField, ExpressionWrapper, Q
 
 from maasserver.config import RegionConfiguration
 from maasserver.forms import ControllerForm
-from maasserver.models import Config, Controller, Event, RackController, VLAN
+from maasserver.models import Config, Controller, RackController, VLAN
 from maasserver.models.controllerinfo import get_target_version
 from maasserver.permissions import NodePermission
 from maasserver.websockets.base import HandlerError, HandlerPermissionError
 from maasserver.websockets.handlers.machine import MachineHandler
-from maasserver.websockets.handlers.node import node_prefetch
+from maasserver.websockets.handlers.node import (
+    node_prefetch,
+    node_status_message_subquery,
+)
 
 # return the list of VLAN ids connected to a controller
 _vlan_ids_aggr = ArrayAgg(
@@ -49,20 +45,7 @@ class ControllerHandler(MachineHandler):
             .prefetch_related("ownerdata_set")
             .prefetch_related("interface_set__ip_addresses__subnet__vlan")
             .annotate(
-                status_event_type_description=Subquery(
-                    Event.objects.filter(
-                        node=OuterRef("pk"), type__level__gte=logging.INFO
-                    )
-                    .order_by("-created", "-id")
-                    .values("type__description")[:1]
-                ),
-                status_event_description=Subquery(
-                    Event.objects.filter(
-                        node=OuterRef("pk"), type__level__gte=logging.INFO
-                    )
-                    .order_by("-created", "-id")
-                    .values("description")[:1]
-                ),
+                status_event_message=node_status_message_subquery,
                 vlan_ids=_vlan_ids_aggr,
             )
         )
@@ -110,14 +110,15 @@ class GeneralHandler(Handler):
         releases = list_all_usable_releases()
         osystems = list_all_usable_osystems(releases)
         kernels = list_all_usable_hwe_kernels(releases)
+        configs = Config.objects.get_configs(
+            ["default_osystem", "default_distro_series"]
+        )
         return {
             "osystems": list_osystem_choices(osystems, include_default=False),
             "releases": list_release_choices(releases, include_default=False),
             "kernels": kernels,
-            "default_osystem": Config.objects.get_config("default_osystem"),
-            "default_release": Config.objects.get_config(
-                "default_distro_series"
-            ),
+            "default_osystem": configs["default_osystem"],
+            "default_release": configs["default_distro_series"],
         }
 
     def dehydrate_actions(self, actions):
@@ -211,16 +212,17 @@ class GeneralHandler(Handler):
 
     def release_options(self, params):
         """Return global release options."""
+        configs = Config.objects.get_configs(
+            [
+                "enable_disk_erasing_on_release",
+                "disk_erase_with_secure_erase",
+                "disk_erase_with_quick_erase",
+            ]
+        )
         return {
-            "erase": Config.objects.get_config(
-                "enable_disk_erasing_on_release"
-            ),
-            "secure_erase": Config.objects.get_config(
-                "disk_erase_with_secure_erase"
-            ),
-            "quick_erase": Config.objects.get_config(
-                "disk_erase_with_quick_erase"
-            ),
+            "erase": configs["enable_disk_erasing_on_release"],
+            "secure_erase": configs["disk_erase_with_secure_erase"],
+            "quick_erase": configs["disk_erase_with_quick_erase"],
         }
 
     def known_boot_architectures(self, params):
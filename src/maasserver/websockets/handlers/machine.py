@@ -5,11 +5,10 @@
 
 
 from functools import partial
-import logging
 from operator import itemgetter
 
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
-from django.db.models import Count, Exists, OuterRef, Subquery
+from django.db.models import Count, Exists, OuterRef, Prefetch
 
 from maasserver.enum import (
     BMC_TYPE,
@@ -54,13 +53,13 @@ from maasserver.forms.interface_link import InterfaceLinkForm
 from maasserver.models import (
     BlockDevice,
     CacheSet,
-    Event,
     Filesystem,
     Interface,
     Machine,
     Node,
     OwnerData,
     Partition,
+    ResourcePool,
     Subnet,
     VolumeGroup,
 )
@@ -80,7 +79,11 @@ from maasserver.websockets.base import (
     HandlerPermissionError,
     HandlerValidationError,
 )
-from maasserver.websockets.handlers.node import node_prefetch, NodeHandler
+from maasserver.websockets.handlers.node import (
+    node_prefetch,
+    node_status_message_subquery,
+    NodeHandler,
+)
 from metadataserver.enum import HARDWARE_TYPE, RESULT_TYPE
 from provisioningserver.certificates import Certificate
 from provisioningserver.logger import LegacyLogger
@@ -118,6 +121,12 @@ class MachineHandler(NodeHandler):
                 "blockdevice_set__virtualblockdevice__"
                 "partitiontable_set__partitions"
             )
+            .prefetch_related(
+                Prefetch(
+                    "interface_set",
+                    queryset=Interface.objects.order_by("name"),
+                )
+            )
             .prefetch_related(
                 "interface_set__ip_addresses__subnet__vlan__space"
             )
@@ -128,23 +137,16 @@ class MachineHandler(NodeHandler):
             .prefetch_related("interface_set__vlan__fabric")
             .prefetch_related("boot_interface__vlan__fabric")
             .prefetch_related("tags")
-            .prefetch_related("pool")
+            # Pools are shared by many machines and the list only shows
+            # their id and name.
+            .prefetch_related(
+                Prefetch(
+                    "pool", queryset=ResourcePool.objects.only("id", "name")
+                )
+            )
             .prefetch_related("ownerdata_set")
             .annotate(
-                status_event_type_description=Subquery(
-                    Event.objects.filter(
-                        node=OuterRef("pk"), type__level__gte=logging.INFO
-                    )
-                    .order_by("-created", "-id")
-                    .values("type__description")[:1]
-                ),
-                status_event_description=Subquery(
-                    Event.objects.filter(
-                        node=OuterRef("pk"), type__level__gte=logging.INFO
-                    )
-                    .order_by("-created", "-id")
-                    .values("description")[:1]
-                ),
+                status_event_message=node_status_message_subquery,
                 numa_nodes_count=Count("numanode"),
                 sriov_support=Exists(
                     Interface.objects.filter(
@@ -269,17 +271,11 @@ class MachineHandler(NodeHandler):
         data.update(
             {"locked": obj.locked, "pool": self.dehydrate_pool(obj.pool)}
         )
-        # Try to use the annotated event description so its loaded in the same
+        # Try to use the annotated status message so its loaded in the same
         # query as loading the machines. Otherwise fallback to the method on
         # the machine.
-        if hasattr(obj, "status_event_description"):
-            if obj.status_event_description:
-                data["status_message"] = "%s - %s" % (
-                    obj.status_event_type_description,
-                    obj.status_event_description,
-                )
-            else:
-                data["status_message"] = obj.status_event_type_description
+        if hasattr(obj, "status_event_message"):
+            data["status_message"] = obj.status_event_message
         else:
             data["status_message"] = obj.status_message()
 
@@ -461,13 +457,15 @@ class MachineHandler(NodeHandler):
 
     def update(self, params):
         """Update the object from params."""
-        data = super().update(params)
+        obj = self.get_object(params)
+        obj = self._update(obj, params)
         if "tags" in params:
-            node_obj = Node.objects.get(system_id=data["system_id"])
-            self.update_tags(node_obj, params["tags"])
-            node_obj.save()
-            return self.full_dehydrate(self.refetch(node_obj))
-        return data
+            # Only dehydrate once the tags are set, rather than dehydrating
+            # the updated machine and then again after refetching it.
+            self.update_tags(obj, params["tags"])
+            obj.save()
+            obj = self.refetch(obj)
+        return self.full_dehydrate(obj)
 
     def mount_special(self, params):
         """Mount a special-purpose filesystem, like tmpfs.
@@ -1054,7 +1052,9 @@ class MachineHandler(NodeHandler):
         else:
             raise ValidationError(form.errors)
         if "mode" in params:
-            self.link_subnet(params)
+            # Reuse the node and interface we already have rather than
+            # fetching both again through `link_subnet`.
+            self._link_subnet(interface, params)
         return self.full_dehydrate(node)
 
     def delete_interface(self, params):
@@ -1071,6 +1071,9 @@ class MachineHandler(NodeHandler):
             params, permission=self._meta.edit_permission
         )
         interface = Interface.objects.get(node=node, id=params["interface_id"])
+        self._link_subnet(interface, params)
+
+    def _link_subnet(self, interface, params):
         subnet = None
         if "subnet" in params:
             subnet = Subnet.objects.get(id=params["subnet"])
@@ -7,9 +7,18 @@
 from collections import Counter
 from itertools import chain
 import logging
-from operator import attrgetter, itemgetter
-
-from django.db.models import Prefetch
+from operator import itemgetter
+
+from django.db.models import (
+    F,
+    Func,
+    OuterRef,
+    Prefetch,
+    Subquery,
+    TextField,
+    Value,
+)
+from django.db.models.functions import NullIf
 from lxml import etree
 
 from maasserver.enum import (
@@ -70,34 +79,45 @@ NODE_TYPE_TO_LINK_TYPE = {
 
 
 def node_prefetch(queryset, *args):
-    return (
-        queryset.select_related(
-            "owner", "zone", "pool", "domain", "bmc", *args
-        )
-        .prefetch_related("blockdevice_set__partitiontable_set__partitions")
-        .prefetch_related("blockdevice_set__physicalblockdevice")
-        .prefetch_related("blockdevice_set__physicalblockdevice__numa_node")
-        .prefetch_related("blockdevice_set__virtualblockdevice")
-        .prefetch_related(
-            Prefetch(
-                "interface_set", queryset=Interface.objects.order_by("name")
-            )
-        )
-        .prefetch_related("interface_set__ip_addresses__subnet__vlan__space")
-        .prefetch_related("interface_set__ip_addresses__subnet__vlan__fabric")
-        .prefetch_related("interface_set__numa_node")
-        .prefetch_related("interface_set__vlan__fabric")
-        .prefetch_related("boot_interface__vlan__fabric")
-        .prefetch_related("nodemetadata_set")
-        .prefetch_related("special_filesystems")
-        .prefetch_related("tags")
-        .prefetch_related(
-            Prefetch(
-                "numanode_set", queryset=NUMANode.objects.order_by("index")
-            )
+    return queryset.select_related(
+        "owner", "zone", "pool", "domain", "bmc", *args
+    ).prefetch_related(
+        "blockdevice_set__partitiontable_set__partitions",
+        "blockdevice_set__physicalblockdevice",
+        "blockdevice_set__physicalblockdevice__numa_node",
+        "blockdevice_set__virtualblockdevice",
+        Prefetch("interface_set", queryset=Interface.objects.order_by("name")),
+        "interface_set__ip_addresses__subnet__vlan__space",
+        "interface_set__ip_addresses__subnet__vlan__fabric",
+        "interface_set__numa_node",
+        "interface_set__vlan__fabric",
+        "boot_interface__vlan__fabric",
+        "nodemetadata_set",
+        "special_filesystems",
+        "tags",
+        Prefetch("numanode_set", queryset=NUMANode.objects.order_by("index")),
+        "numanode_set__hugepages_set",
+    )
+
+
+# The most recent INFO (or above) event for the node, formatted like
+# `Node.status_message()`. Building the whole message in one subquery means
+# the events are only looked up once per node.
+node_status_message_subquery = Subquery(
+    Event.objects.filter(node=OuterRef("pk"), type__level__gte=logging.INFO)
+    .order_by("-created", "-id")
+    .annotate(
+        message=Func(
+            Value(" - "),
+            F("type__description"),
+            NullIf(F("description"), Value("")),
+            function="concat_ws",
+            output_field=TextField(),
         )
-        .prefetch_related("numanode_set__hugepages_set")
     )
+    .values("message")[:1],
+    output_field=TextField(),
+)
 
 
 class NodeHandler(TimestampedModelHandler):
@@ -788,11 +808,11 @@ class NodeHandler(TimestampedModelHandler):
 
         boot_interface = obj.get_boot_interface()
 
+        # The handler querysets prefetch `interface_set` ordered by name, so
+        # there is no need to sort the interfaces here.
         ip_addresses = [
             {"ip": ip_address.get_ip(), "is_boot": interface == boot_interface}
-            for interface in sorted(
-                obj.interface_set.all(), key=attrgetter("name")
-            )
+            for interface in obj.interface_set.all()
             for ip_address in interface.ip_addresses.all()
             if ip_address.ip
             and ip_address.alloc_type
@@ -807,9 +827,7 @@ class NodeHandler(TimestampedModelHandler):
         if len(ip_addresses) == 0:
             ip_addresses = [
                 {"ip": ip_address.ip, "is_boot": interface == boot_interface}
-                for interface in sorted(
-                    obj.interface_set.all(), key=attrgetter("name")
-                )
+                for interface in obj.interface_set.all()
                 for ip_address in interface.ip_addresses.all()
                 if (
                     ip_address.ip
@@ -1003,7 +1021,7 @@ class NodeHandler(TimestampedModelHandler):
         # We check here if there's something to show instead of after
         # the call to get_single_probed_details() because here the
         # details will be guaranteed well-formed.
-        if len(probed_details.xpath("/*/*")) == 0:
+        if len(probed_details.getroot()) == 0:
             return ""
         else:
             return etree.tostring(
@@ -1039,12 +1057,10 @@ class NodeHandler(TimestampedModelHandler):
         # We check here if there's something to show instead of after
         # the call to get_single_probed_details() because here the
         # details will be guaranteed well-formed.
-        if len(probed_details.xpath("/*/*")) == 0:
+        if len(probed_details.getroot()) == 0:
             return ""
         else:
-            return XMLToYAML(
-                etree.tostring(probed_details, encoding=str, pretty_print=True)
-            ).convert()
+            return XMLToYAML(probed_details.getroot()).convert()
 
     def set_script_result_suppressed(self, params):
         """Set suppressed for the ScriptResult ids."""
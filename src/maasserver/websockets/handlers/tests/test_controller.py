@@ -2,6 +2,8 @@
 # GNU Affero General Public License version 3 (see the file LICENSE).
 
 
+import logging
+
 from maasserver.config import RegionConfiguration
 from maasserver.enum import NODE_TYPE
 from maasserver.forms import ControllerForm
@@ -94,6 +96,15 @@ class TestControllerHandler(MAASServerTestCase):
         self.assertEqual(1, len(result))
         self.assertEqual(NODE_TYPE.RACK_CONTROLLER, result[0].get("node_type"))
 
+    def test_list_includes_status_message(self):
+        owner = factory.make_admin()
+        handler = ControllerHandler(owner, {}, None)
+        node = factory.make_RackController(owner=owner)
+        event_type = factory.make_EventType(level=logging.INFO)
+        factory.make_Event(node=node, type=event_type, description="")
+        [data] = handler.list({})
+        self.assertEqual(event_type.description, data["status_message"])
+
     def test_list_num_queries_is_the_expected_number(self):
         self.useFixture(RBACForceOffFixture())
 
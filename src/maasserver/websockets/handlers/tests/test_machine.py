@@ -111,7 +111,10 @@ from maasserver.websockets.handlers import node as node_module
 from maasserver.websockets.handlers.event import dehydrate_event_type_level
 from maasserver.websockets.handlers.machine import MachineHandler
 from maasserver.websockets.handlers.machine import Node as node_model
-from maasserver.websockets.handlers.node import NODE_TYPE_TO_LINK_TYPE
+from maasserver.websockets.handlers.node import (
+    node_prefetch,
+    NODE_TYPE_TO_LINK_TYPE,
+)
 from maasserver.websockets.handlers.node_result import NodeResultHandler
 from maastesting.djangotestcase import count_queries
 from maastesting.matchers import MockCalledOnceWith, MockNotCalled
@@ -381,7 +384,10 @@ class TestMachineHandler(MAASServerTestCase):
             }
         if boot_interface:
             data["vlan"] = handler.dehydrate_vlan(node, boot_interface)
-            data["ip_addresses"] = handler.dehydrate_all_ip_addresses(node)
+            # The handler relies on its queryset to order the interfaces.
+            data["ip_addresses"] = handler.dehydrate_all_ip_addresses(
+                node_prefetch(Node.objects.filter(id=node.id)).get()
+            )
         bmc = node.bmc
         if bmc is not None and bmc.bmc_type == BMC_TYPE.POD:
             data["pod"] = {"id": bmc.id, "name": bmc.name}
@@ -1843,6 +1849,26 @@ class TestMachineHandler(MAASServerTestCase):
             observed,
         )
 
+    def test_get_summary_yaml_converts_merged_details(self):
+        owner = factory.make_User()
+        node = factory.make_Node(owner=owner, with_empty_script_sets=True)
+        handler = MachineHandler(owner, {}, None)
+        lldp_data = b'<foo a="b">\n  <bar>baz</bar>\n</foo>'
+        script_set = node.current_commissioning_script_set
+        script_result = script_set.find_script_result(
+            script_name=LLDP_OUTPUT_NAME
+        )
+        script_result.store_result(exit_status=0, stdout=lldp_data)
+        observed = handler.get_summary_yaml({"system_id": node.system_id})
+        self.assertEqual(
+            "- list:\n"
+            "  - lldp:foo:\n"
+            "    a: b\n"
+            "    - lldp:bar:\n"
+            "      baz\n",
+            observed,
+        )
+
     def test_get_summary_yaml_returns_empty_string(self):
         owner = factory.make_User()
         node = factory.make_Node(owner=owner)
@@ -2262,6 +2288,19 @@ class TestMachineHandler(MAASServerTestCase):
             handler._script_results,
         )
 
+    def test_list_includes_status_message(self):
+        user = factory.make_User()
+        node = factory.make_Node(owner=user)
+        event_type = factory.make_EventType(level=logging.INFO)
+        factory.make_Event(node=node, type=event_type, description="")
+        event = factory.make_Event(node=node, type=event_type)
+        handler = MachineHandler(user, {}, None)
+        [data] = handler.list({})
+        self.assertEqual(
+            f"{event_type.description} - {event.description}",
+            data["status_message"],
+        )
+
     def test_list_includes_numa_node_info(self):
         user = factory.make_User()
         machine = factory.make_Machine(owner=user)
@@ -2658,6 +2697,19 @@ class TestMachineHandler(MAASServerTestCase):
         updated_node = handler.update(node_data)
         self.assertCountEqual(tags, updated_node["tags"])
 
+    def test_update_with_tags_dehydrates_once(self):
+        user = factory.make_admin()
+        handler = MachineHandler(user, {}, None)
+        architecture = make_usable_architecture(self)
+        node = factory.make_Node(
+            interface=True, architecture=architecture, power_type="manual"
+        )
+        node_data = self.dehydrate_node(node, handler)
+        node_data["tags"] = [factory.make_Tag(definition="").id]
+        full_dehydrate = self.patch(handler, "full_dehydrate")
+        handler.update(node_data)
+        full_dehydrate.assert_called_once()
+
     def test_update_removes_tag_from_node(self):
         user = factory.make_admin()
         handler = MachineHandler(user, {}, None)
@@ -20,7 +20,6 @@ from django.db.models import (
     TextField,
 )
 from django.db.models.functions import Coalesce
-from django.db.models.query import QuerySet
 
 from maasserver.enum import POWER_STATE, POWER_STATE_CHOICES
 from maasserver.exceptions import NoScriptsFound
@@ -59,12 +58,11 @@ def _get_hw_pairs(script_set):
 
 def get_status_from_qs(qs):
     """Given a QuerySet or list of ScriptResults return the set's status."""
+    # The results are needed below anyway, so evaluate a QuerySet once here
+    # instead of running a separate COUNT query first.
+    script_results = list(qs)
     # If no tests have been run the QuerySet or list has no status.
-    if isinstance(qs, QuerySet):
-        count = qs.count()
-    else:
-        count = len(qs)
-    if count == 0:
+    if len(script_results) == 0:
         return -1
     # The status order below represents the order of precedence.
     # Skipped is omitted here otherwise one skipped test will show
@@ -81,7 +79,7 @@ def get_status_from_qs(qs):
         SCRIPT_STATUS.TIMEDOUT,
         SCRIPT_STATUS.DEGRADED,
     ):
-        for script_result in qs:
+        for script_result in script_results:
             if script_result.status == status and not script_result.suppressed:
                 if status in SCRIPT_STATUS_RUNNING:
                     return SCRIPT_STATUS.RUNNING